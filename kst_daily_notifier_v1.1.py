@@ -7,6 +7,13 @@
 #   Linux  : ~/.config/KSTDailyNotifier/schedules.json
 # - 기존 실행 폴더의 schedules.json이 있으면 최초 1회 자동 마이그레이션
 # - ZoneInfo가 없으면 KST(UTC+9) 고정 오프셋으로 동작
+# - 제외 캘린더(공휴일/휴가) 지원: calendars 폴더의 <이름>.txt 파일을 읽어
+#   일정별로 연결, 해당 날짜에는 알림을 건너뜀
+# - 일정 미리보기(1일/7일/30일): 전체 일정의 다음 알림을 한 번에 계산해
+#   시간순으로 표시 (numpy가 있으면 벡터 연산 사용), 같은 시각 중복 표시
+# - 제목 검색(입력 즉시) + 요일/사용 여부/시간대 필터, 필터 결과 일괄 삭제/토글/수정
+# - 헤드리스 모드(--headless --workers N): 일정 id 해시로 여러 프로세스에 분산,
+#   각 워커가 마감 시각 힙을 유지하고 발생 이벤트를 파이프로 디스패처에 전달
 #---------------------------------------------------------------------#
 """
 KST Daily Notifier (요일 지정 + 포터블 배포 대응)
@@ -14,19 +21,37 @@ KST Daily Notifier (요일 지정 + 포터블 배포 대응)
 - 확인(OK) 시 닫힘, 삭제 전까지 반복
 - 확인 주기(초) 조절, 지연 보정: [알림시각 - (5분 + 확인주기)]
 - 데이터 로컬 저장 (OS 표준 사용자 경로)
+- 제외 캘린더: 연도별 비트셋으로 미리 계산해 O(1)로 제외 여부 확인
+- 일정 미리보기: 요일별 정렬 버킷으로 일괄 계산, 페이지 단위로 지연 표시
+- 일정 검색: 바이그램 역색인 + 정렬된 제목(접두어) 목록, 필터 결과 일괄 처리 후 1회 저장
+- 헤드리스 모드: 대량 일정(수백만 건)을 프로세스 풀로 샤딩해 초 단위로 알림 이벤트 처리
 """
+import argparse
+import heapq
 import json
+import multiprocessing
 import os
 import platform
+import queue
+import signal
+import sys
 import threading
 import time
+import uuid
+from bisect import bisect_left, bisect_right
+from collections import deque
+from multiprocessing.connection import wait as mp_wait
 from pathlib import Path
-from dataclasses import dataclass, asdict, field
-from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass, asdict, field, fields
+from datetime import date, datetime, timedelta, timezone
 try:
     from zoneinfo import ZoneInfo  # Python 3.9+
 except Exception:
     ZoneInfo = None
+try:
+    import numpy as np  # 선택: 일정 미리보기 벡터 연산
+except Exception:
+    np = None
 
 import tkinter as tk
 from tkinter import ttk, messagebox
@@ -35,6 +60,14 @@ APP_NAME = "KSTDailyNotifier"
 DEFAULT_INTERVAL_SEC = 30
 KST_TZNAME = "Asia/Seoul"
 KOR_WD = ["월", "화", "수", "목", "금", "토", "일"]
+AGENDA_RANGES = {"1일": 1, "7일": 7, "30일": 30}
+AGENDA_PAGE_SIZE = 200
+TREE_PAGE_SIZE = 200
+FILTER_ALL = "전체"
+FILTER_ACTIVE = ["전체", "사용", "미사용"]
+ALERT_LEAD_SEC = 5 * 60
+SHARD_BATCH = 5000
+HEADLESS_SAVE_SEC = 60
 
 # ---------- Portable data path helpers ----------
 def get_data_dir() -> Path:
@@ -52,6 +85,7 @@ def get_data_dir() -> Path:
 DATA_DIR = get_data_dir()
 DATA_FILE = DATA_DIR / "schedules.json"
 LEGACY_FILE = Path("schedules.json")
+CALENDAR_DIR = DATA_DIR / "calendars"
 
 def migrate_legacy_file():
     try:
@@ -61,6 +95,108 @@ def migrate_legacy_file():
     except Exception:
         pass
 
+def kst_timezone():
+    if ZoneInfo is not None:
+        try:
+            return ZoneInfo(KST_TZNAME)
+        except Exception:
+            pass
+    return timezone(timedelta(hours=9))
+
+# ---------- Exclusion calendars ----------
+class ExclusionCalendar:
+    """
+    공휴일/휴가 등 알림을 건너뛸 날짜 모음.
+    - 연도별로 (1월 1일 = bit 0) 비트셋(int)을 미리 계산해 두고 조회는 O(1)
+    - 여러 일정이 같은 인스턴스를 공유 (일정마다 복사하지 않음)
+    """
+    def __init__(self, name: str, dates=()):
+        self.name = name
+        self._bits = {}
+        for d in dates:
+            self.add(d)
+
+    def add(self, d: date):
+        self._bits[d.year] = self._bits.get(d.year, 0) | (1 << (d.timetuple().tm_yday - 1))
+
+    def is_excluded(self, d: date) -> bool:
+        return bool((self._bits.get(d.year, 0) >> (d.timetuple().tm_yday - 1)) & 1)
+
+    def __len__(self):
+        return sum(bin(b).count("1") for b in self._bits.values())
+
+    @staticmethod
+    def from_file(path: Path):
+        """
+        한 줄에 하나씩 날짜를 적은 텍스트 파일을 읽습니다. (# 이후는 주석)
+          2025-10-03            # 개천절
+          2025-12-24 ~ 2025-12-31  # 연차(기간)
+        """
+        cal = ExclusionCalendar(path.stem)
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.split("#", 1)[0].strip()
+                if not line:
+                    continue
+                try:
+                    if "~" in line:
+                        a, b = (x.strip() for x in line.split("~", 1))
+                        d, end = date.fromisoformat(a), date.fromisoformat(b)
+                        while d <= end:
+                            cal.add(d)
+                            d += timedelta(days=1)
+                    else:
+                        cal.add(date.fromisoformat(line))
+                except ValueError:
+                    print(f"캘린더 형식 오류 ({path.name}): {line}")
+        return cal
+
+def load_calendars() -> dict:
+    try:
+        CALENDAR_DIR.mkdir(parents=True, exist_ok=True)
+    except Exception:
+        return {}
+    calendars = {}
+    for path in sorted(CALENDAR_DIR.glob("*.txt")):
+        try:
+            calendars[path.stem] = ExclusionCalendar.from_file(path)
+        except Exception as e:
+            print("캘린더 로드 오류:", path, e)
+    return calendars
+
+def is_excluded(schedule, calendars: dict, d: date) -> bool:
+    for name in schedule.calendars:
+        cal = calendars.get(name)
+        if cal is not None and cal.is_excluded(d):
+            return True
+    return False
+
+def parse_time_str(time_str: str):
+    parts = time_str.split(":")
+    if len(parts) == 2:
+        hh, mm = int(parts[0]), int(parts[1]); ss = 0
+    elif len(parts) == 3:
+        hh, mm, ss = int(parts[0]), int(parts[1]), int(parts[2])
+    else:
+        raise ValueError("시간 형식은 HH:MM 또는 HH:MM:SS")
+    return hh, mm, ss
+
+def next_occurrence(schedule, now_kst: datetime, calendars: dict, max_days: int = 731):
+    """요일/제외 캘린더/오늘 발송 여부를 반영한 다음 알림 시각 (없으면 None)"""
+    if not schedule.days:
+        return None
+    hh, mm, ss = parse_time_str(schedule.time_str)
+    today_str = now_kst.strftime("%Y-%m-%d")
+    for offset in range(max_days):
+        day = now_kst + timedelta(days=offset)
+        if day.weekday() not in schedule.days or is_excluded(schedule, calendars, day):
+            continue
+        target_dt = datetime(day.year, day.month, day.day, hh, mm, ss, tzinfo=now_kst.tzinfo)
+        if offset == 0 and (target_dt <= now_kst or schedule.last_fired_date == today_str):
+            continue
+        return target_dt
+    return None
+
 # ---------- Data model ----------
 @dataclass
 class Schedule:
@@ -69,6 +205,8 @@ class Schedule:
     days: list = field(default_factory=lambda: [0,1,2,3,4,5,6])
     active: bool = True
     last_fired_date: str = ""
+    calendars: list = field(default_factory=list)  # 제외 캘린더 이름 목록
+    sid: str = field(default_factory=lambda: uuid.uuid4().hex)  # 샤딩/동기화용 고유 id
 
     def to_dict(self):
         return asdict(self)
@@ -82,18 +220,219 @@ class Schedule:
             days=days,
             active=d.get("active", True),
             last_fired_date=d.get("last_fired_date", ""),
+            calendars=d.get("calendars", []),
+            sid=d.get("sid") or uuid.uuid4().hex,
         )
 
+    def to_row(self):
+        # 프로세스 간 전송용 (dict/dataclass보다 pickle 비용이 훨씬 작음)
+        return (self.title, self.time_str, self.days, self.active, self.last_fired_date, self.calendars, self.sid)
+
+    @staticmethod
+    def from_row(row):
+        return Schedule(*row)
+
+def read_schedules():
+    if not DATA_FILE.exists():
+        return []
+    with open(DATA_FILE, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return [Schedule.from_dict(x) for x in data.get("schedules", [])]
+
+def read_schedules_checked():
+    """read_schedules + sid가 없던 항목 존재 여부 (있으면 부여된 id를 다시 저장해야 함)"""
+    if not DATA_FILE.exists():
+        return [], False
+    with open(DATA_FILE, "r", encoding="utf-8") as f:
+        entries = json.load(f).get("schedules", [])
+    return [Schedule.from_dict(x) for x in entries], any(not x.get("sid") for x in entries)
+
+def write_schedules(schedules):
+    with open(DATA_FILE, "w", encoding="utf-8") as f:
+        json.dump({"schedules": [s.to_dict() for s in schedules]}, f, ensure_ascii=False, indent=2)
+
+def write_schedule_rows(rows):
+    """
+    Schedule.to_row() 목록을 저장 (대량 일정용).
+    - asdict/indent 없이 기록하고, 임시 파일에 쓴 뒤 교체해 중간에 끊겨도 기존 파일 유지
+    """
+    names = [f.name for f in fields(Schedule)]
+    tmp = DATA_FILE.with_name(DATA_FILE.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"schedules": [dict(zip(names, r)) for r in rows]}, f, ensure_ascii=False)
+    os.replace(tmp, DATA_FILE)
+
+# ---------- Agenda (batched next occurrences) ----------
+class Agenda:
+    """
+    [now, now + days) 구간의 모든 일정 발생 시각을 시간순으로 계산.
+    - 일정을 요일별 버킷(초 단위 시각 기준 정렬)으로 한 번만 나누고,
+      날짜마다 해당 요일 버킷을 잘라 붙이므로 전체 정렬이 필요 없음
+    - 제외 캘린더는 캘린더별 비트를 일정 마스크와 AND 해서 일괄 필터
+    - page(start, count)로 필요한 만큼만 (ts, 일정 index, 중복 여부) 생성
+    """
+    def __init__(self, schedules, calendars: dict, now_kst: datetime, days: int):
+        self.schedules = list(schedules)
+        today_str = now_kst.strftime("%Y-%m-%d")
+        cal_bits = {name: 1 << i for i, name in enumerate(calendars)}
+        use_np = np is not None and len(cal_bits) < 63
+
+        secs, idxs, cms, wmasks = [], [], [], []
+        sec_of = {}  # 같은 time_str은 한 번만 파싱
+        fired = set()
+        for idx, s in enumerate(self.schedules):
+            if not s.active:
+                continue
+            sec = sec_of.get(s.time_str)
+            if sec is None:
+                try:
+                    hh, mm, ss = parse_time_str(s.time_str)
+                    sec = hh * 3600 + mm * 60 + ss
+                except ValueError:
+                    sec = -1
+                sec_of[s.time_str] = sec
+            if sec < 0:
+                continue
+            cmask = 0
+            for name in s.calendars:
+                cmask |= cal_bits.get(name, 0)
+            wmask = 0
+            for d in s.days:
+                wmask |= 1 << d
+            secs.append(sec); idxs.append(idx); cms.append(cmask); wmasks.append(wmask)
+            if s.last_fired_date == today_str:
+                fired.add(idx)
+
+        # 시각 기준으로 한 번만 정렬한 뒤 요일 마스크로 (secs, idxs, cal_masks) 버킷 분리
+        cols = []
+        if use_np:
+            secs, idxs, cms, wmasks = (np.array(c, dtype=np.int64) for c in (secs, idxs, cms, wmasks))
+            order = np.argsort(secs, kind="stable")
+            secs, idxs, cms, wmasks = secs[order], idxs[order], cms[order], wmasks[order]
+            for d in range(7):
+                sel = ((wmasks >> d) & 1) == 1
+                cols.append((secs[sel], idxs[sel], cms[sel]))
+        else:
+            order = sorted(range(len(secs)), key=secs.__getitem__)
+            for d in range(7):
+                bit = 1 << d
+                js = [j for j in order if wmasks[j] & bit]
+                cols.append(([secs[j] for j in js], [idxs[j] for j in js], [cms[j] for j in js]))
+        fired_np = np.array(sorted(fired), dtype=np.int64) if use_np else None
+
+        midnight = now_kst.replace(hour=0, minute=0, second=0, microsecond=0)
+        now_sec = now_kst.hour * 3600 + now_kst.minute * 60 + now_kst.second
+        self._chunks = []   # (자정 epoch, secs, idxs)
+        self._starts = []   # 각 chunk의 전체 순번 시작값
+        total = 0
+        for off in range(days + 1):
+            day = midnight + timedelta(days=off)
+            secs, idxs, cms = cols[day.weekday()]
+            lo, hi = 0, len(secs)
+            if off == 0:
+                lo = bisect_right(secs, now_sec) if not use_np else int(np.searchsorted(secs, now_sec, "right"))
+            if off == days:
+                hi = bisect_left(secs, now_sec) if not use_np else int(np.searchsorted(secs, now_sec, "left"))
+            if lo >= hi:
+                continue
+            day_cal = 0
+            for name, cal in calendars.items():
+                if cal.is_excluded(day):
+                    day_cal |= cal_bits[name]
+            drop = fired if off == 0 else ()
+            if use_np:
+                s_, i_ = secs[lo:hi], idxs[lo:hi]
+                if day_cal or drop:
+                    keep = (cms[lo:hi] & day_cal) == 0
+                    if drop:
+                        keep &= ~np.isin(i_, fired_np)
+                    s_, i_ = s_[keep], i_[keep]
+            elif day_cal or drop:
+                keep = [j for j in range(lo, hi) if not cms[j] & day_cal and idxs[j] not in drop]
+                s_, i_ = [secs[j] for j in keep], [idxs[j] for j in keep]
+            else:
+                s_, i_ = secs[lo:hi], idxs[lo:hi]
+            if len(s_):
+                self._chunks.append((int(day.timestamp()), s_, i_))
+                self._starts.append(total)
+                total += len(s_)
+        self._total = total
+
+    def __len__(self):
+        return self._total
+
+    def page(self, start: int, count: int):
+        rows = []
+        if start >= self._total:
+            return rows
+        ci = bisect_right(self._starts, start) - 1
+        k = start - self._starts[ci]
+        while len(rows) < count and ci < len(self._chunks):
+            base, secs, idxs = self._chunks[ci]
+            n = len(secs)
+            stop = min(n, k + count - len(rows))
+            for j in range(k, stop):
+                sec = int(secs[j])
+                dup = (j > 0 and secs[j - 1] == sec) or (j + 1 < n and secs[j + 1] == sec)
+                rows.append((base + sec, int(idxs[j]), bool(dup)))
+            ci += 1
+            k = 0
+        return rows
+
+# ---------- Title search index ----------
+class TitleIndex:
+    """
+    일정 제목 검색용 인덱스 (대소문자 무시, 부분 문자열 일치).
+    - 바이그램(+한 글자) 역색인으로 후보를 좁힌 뒤 실제 포함 여부 확인
+    - 정렬된 제목 목록으로 접두어 일치 결과를 앞쪽에 배치
+    - 직전 검색어를 포함하는 검색어(한 글자 추가 입력 등)는 직전 결과 안에서만 검색
+    """
+    def __init__(self, titles):
+        self._titles = [t.lower() for t in titles]
+        self._grams = {}
+        for idx, t in enumerate(self._titles):
+            for g in {t[i:i + 2] for i in range(len(t) - 1)} | set(t):
+                self._grams.setdefault(g, set()).add(idx)
+        self._sorted = sorted((t, idx) for idx, t in enumerate(self._titles))
+        self._last = ("", None)
+
+    def __len__(self):
+        return len(self._titles)
+
+    def search(self, query: str):
+        q = query.strip().lower()
+        if not q:
+            return list(range(len(self._titles)))
+        last_q, last_res = self._last
+        if last_res is not None and last_q in q:
+            cands = last_res
+        else:
+            grams = [q[i:i + 2] for i in range(len(q) - 1)] or [q]
+            posting = sorted((self._grams.get(g, set()) for g in grams), key=len)
+            cands = set.intersection(*posting)
+        hits = [i for i in cands if q in self._titles[i]]
+        lo = bisect_left(self._sorted, (q,))
+        hi = bisect_left(self._sorted, (q + "\uffff",))
+        prefix = {idx for _, idx in self._sorted[lo:hi]}
+        result = sorted(hits, key=lambda i: (i not in prefix, i))
+        self._last = (q, result)
+        return result
+
 class NotifierApp:
     def __init__(self, root):
         self.root = root
         self.root.title("KST Daily Notifier (요일/시간 알림)")
-        self.root.geometry("900x620")
+        self.root.geometry("900x680")
 
         self.tz = self._init_timezone()
 
         migrate_legacy_file()
+        self.calendars = load_calendars()
         self.schedules = self.load_schedules()
+        self._title_index = None
+        self._next_cache = {}   # sid -> (일정 상태 key, 다음 알림 datetime)
+        self._visible = []      # 현재 검색/필터 결과 (목록에는 페이지 단위로 표시)
+        self._rendered = 0
         self.interval_sec = DEFAULT_INTERVAL_SEC
         self.stop_event = threading.Event()
         self.thread = None
@@ -102,27 +441,17 @@ class NotifierApp:
         self.start_thread()
 
     def _init_timezone(self):
-        if ZoneInfo is not None:
-            try:
-                return ZoneInfo(KST_TZNAME)
-            except Exception:
-                pass
-        return timezone(timedelta(hours=9))
+        return kst_timezone()
 
     def load_schedules(self):
-        if not DATA_FILE.exists():
-            return []
         try:
-            with open(DATA_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return [Schedule.from_dict(x) for x in data.get("schedules", [])]
+            return read_schedules()
         except Exception:
             return []
 
     def save_schedules(self):
         try:
-            with open(DATA_FILE, "w", encoding="utf-8") as f:
-                json.dump({"schedules": [s.to_dict() for s in self.schedules]}, f, ensure_ascii=False, indent=2)
+            write_schedules(self.schedules)
         except Exception as e:
             messagebox.showerror("저장 오류", f"일정 저장 중 오류가 발생했습니다:\n{e}")
 
@@ -152,28 +481,85 @@ class NotifierApp:
             chk.pack(side="left", padx=(0, 6))
             self.day_vars.append(var)
 
+        self.calendar_vars = {}
+        if self.calendars:
+            frm_cal = ttk.Frame(self.root, padding=(10, 0, 10, 10))
+            frm_cal.pack(fill="x")
+            ttk.Label(frm_cal, text="제외 캘린더").pack(side="left", padx=(0, 10))
+            for name, cal in self.calendars.items():
+                var = tk.BooleanVar(value=False)
+                ttk.Checkbutton(frm_cal, text=f"{name} ({len(cal)}일)", variable=var).pack(side="left", padx=(0, 6))
+                self.calendar_vars[name] = var
+
+        frm_search = ttk.Frame(self.root, padding=(10, 0, 10, 10))
+        frm_search.pack(fill="x")
+        ttk.Label(frm_search, text="검색").pack(side="left", padx=(0, 4))
+        self.search_var = tk.StringVar()
+        ttk.Entry(frm_search, textvariable=self.search_var, width=20).pack(side="left")
+        ttk.Label(frm_search, text="요일").pack(side="left", padx=(10, 4))
+        self.filter_day_var = tk.StringVar(value=FILTER_ALL)
+        ttk.Combobox(frm_search, textvariable=self.filter_day_var, values=[FILTER_ALL] + KOR_WD,
+                     state="readonly", width=5).pack(side="left")
+        ttk.Label(frm_search, text="사용").pack(side="left", padx=(10, 4))
+        self.filter_active_var = tk.StringVar(value=FILTER_ALL)
+        ttk.Combobox(frm_search, textvariable=self.filter_active_var, values=FILTER_ACTIVE,
+                     state="readonly", width=7).pack(side="left")
+        ttk.Label(frm_search, text="시간").pack(side="left", padx=(10, 4))
+        self.filter_from_var = tk.StringVar()
+        ttk.Entry(frm_search, textvariable=self.filter_from_var, width=8).pack(side="left")
+        ttk.Label(frm_search, text="~").pack(side="left", padx=2)
+        self.filter_to_var = tk.StringVar()
+        ttk.Entry(frm_search, textvariable=self.filter_to_var, width=8).pack(side="left")
+        self.filter_count_var = tk.StringVar()
+        ttk.Label(frm_search, textvariable=self.filter_count_var, foreground="#555").pack(side="left", padx=10)
+        for var in (self.search_var, self.filter_day_var, self.filter_active_var, self.filter_from_var, self.filter_to_var):
+            var.trace_add("write", lambda *_: self.refresh_tree())
+
+        frm_batch = ttk.Frame(self.root, padding=(10, 0, 10, 10))
+        frm_batch.pack(fill="x")
+        ttk.Label(frm_batch, text="검색/필터 결과 일괄").pack(side="left", padx=(0, 10))
+        ttk.Button(frm_batch, text="삭제", command=self.delete_filtered).pack(side="left")
+        ttk.Button(frm_batch, text="활성/비활성", command=self.toggle_filtered).pack(side="left", padx=6)
+        ttk.Button(frm_batch, text="수정", command=self.edit_filtered).pack(side="left")
+        ttk.Label(frm_batch, text="(입력한 시간 +").pack(side="left", padx=(6, 2))
+        self.batch_days_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frm_batch, text="요일 적용", variable=self.batch_days_var).pack(side="left")
+        self.batch_cals_var = tk.BooleanVar(value=False)
+        if self.calendars:
+            ttk.Checkbutton(frm_batch, text="제외 캘린더 적용", variable=self.batch_cals_var).pack(side="left", padx=(6, 0))
+        ttk.Label(frm_batch, text=")").pack(side="left")
+
         frm_mid = ttk.Frame(self.root, padding=(10, 0, 10, 10))
         frm_mid.pack(fill="both", expand=True)
 
-        columns = ("title", "days", "time", "active", "last")
-        self.tree = ttk.Treeview(frm_mid, columns=columns, show="headings", height=10)
+        columns = ("title", "days", "time", "active", "next", "last")
+        self.tree = ttk.Treeview(frm_mid, columns=columns, show="headings", height=10, selectmode="extended")
         self.tree.heading("title", text="제목")
         self.tree.heading("days", text="요일")
         self.tree.heading("time", text="알림 지정시간")
         self.tree.heading("active", text="토글 사용")
+        self.tree.heading("next", text="다음 알림(KST)")
         self.tree.heading("last", text="마지막 확인(KST)")
 
         self.tree.column("title", width=240)
         self.tree.column("days", width=120, anchor="center")
         self.tree.column("time", width=120, anchor="center")
         self.tree.column("active", width=80, anchor="center")
+        self.tree.column("next", width=140, anchor="center")
         self.tree.column("last", width=160, anchor="center")
 
         self.tree.pack(side="left", fill="both", expand=True)
 
         scrollbar = ttk.Scrollbar(frm_mid, orient="vertical", command=self.tree.yview)
         scrollbar.pack(side="right", fill="y")
-        self.tree.configure(yscrollcommand=scrollbar.set)
+
+        def on_yscroll(first, last):
+            scrollbar.set(first, last)
+            # 스크롤이 끝에 가까워지면 다음 페이지를 붙임
+            if float(last) >= 0.95 and self._rendered < len(self._visible):
+                self._render_more()
+
+        self.tree.configure(yscrollcommand=on_yscroll)
 
         self.refresh_tree()
 
@@ -182,6 +568,7 @@ class NotifierApp:
 
         ttk.Button(frm_bot, text="삭제 (선택)", command=self.delete_selected).pack(side="left")
         ttk.Button(frm_bot, text="토글 활성/비활성 (선택)", command=self.toggle_selected).pack(side="left", padx=6)
+        ttk.Button(frm_bot, text="일정 미리보기", command=self.open_agenda).pack(side="left")
 
         ttk.Label(frm_bot, text="확인 주기(초)").pack(side="left", padx=(20, 4))
         self.interval_var = tk.IntVar(value=self.interval_sec)
@@ -191,17 +578,87 @@ class NotifierApp:
 
         hint = (
             "주의: 팝업은 [설정한 알림시간 - (5분 + 주기)]에 시작합니다.\n"
-            f"데이터 파일 위치: {DATA_FILE}"
+            f"데이터 파일 위치: {DATA_FILE}\n"
+            f"제외 캘린더 위치: {CALENDAR_DIR} (<이름>.txt, 한 줄에 YYYY-MM-DD)"
         )
         ttk.Label(self.root, text=hint, foreground="#555").pack(anchor="w", padx=12, pady=(0, 8))
 
     def refresh_tree(self):
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-        for idx, s in enumerate(self.schedules):
+        self.tree.delete(*self.tree.get_children())
+        self._visible = self.filtered_indices()
+        self._rendered = 0
+        self._render_more()
+        self.filter_count_var.set(f"{len(self._visible)} / {len(self.schedules)}건")
+
+    def _render_more(self):
+        now = self._now_kst()
+        end = min(self._rendered + TREE_PAGE_SIZE, len(self._visible))
+        for idx in self._visible[self._rendered:end]:
+            s = self.schedules[idx]
             days_str = ",".join(KOR_WD[d] for d in sorted(s.days))
+            if s.calendars:
+                days_str += " (제외: " + ",".join(s.calendars) + ")"
+            nxt = self._cached_next_occurrence(s, now)
+            next_str = nxt.strftime("%Y-%m-%d %H:%M") if nxt else "-"
             self.tree.insert("", "end", iid=str(idx),
-                             values=(s.title, days_str, s.time_str, "예" if s.active else "아니오", s.last_fired_date or "-"))
+                             values=(s.title, days_str, s.time_str, "예" if s.active else "아니오", next_str, s.last_fired_date or "-"))
+        self._rendered = end
+
+    def _cached_next_occurrence(self, schedule: Schedule, now_kst: datetime):
+        """일정 내용이 같고 캐시된 시각이 아직 지나지 않았으면 재계산하지 않음"""
+        if not schedule.active:
+            return None
+        key = (schedule.time_str, tuple(schedule.days), schedule.last_fired_date, tuple(schedule.calendars))
+        cached = self._next_cache.get(schedule.sid)
+        if cached is not None and cached[0] == key and (cached[1] is None or cached[1] > now_kst):
+            return cached[1]
+        try:
+            nxt = self._next_occurrence(schedule, now_kst)
+        except ValueError:
+            nxt = None
+        self._next_cache[schedule.sid] = (key, nxt)
+        return nxt
+
+    def filtered_indices(self):
+        """검색어 + 요일/사용 여부/시간대 필터를 통과한 일정 index 목록"""
+        if self._title_index is None or len(self._title_index) != len(self.schedules):
+            self._title_index = TitleIndex(s.title for s in self.schedules)
+        idxs = self._title_index.search(self.search_var.get())
+
+        day = self.filter_day_var.get()
+        if day in KOR_WD:
+            wd = KOR_WD.index(day)
+            idxs = [i for i in idxs if wd in self.schedules[i].days]
+
+        active = self.filter_active_var.get()
+        if active != FILTER_ALL:
+            want = active == "사용"
+            idxs = [i for i in idxs if self.schedules[i].active == want]
+
+        lo = self._filter_seconds(self.filter_from_var.get())
+        hi = self._filter_seconds(self.filter_to_var.get())
+        if lo is not None or hi is not None:
+            lo = 0 if lo is None else lo
+            hi = 86399 if hi is None else hi
+            kept = []
+            for i in idxs:
+                try:
+                    hh, mm, ss = parse_time_str(self.schedules[i].time_str)
+                except ValueError:
+                    continue
+                sec = hh * 3600 + mm * 60 + ss
+                # 시작 > 끝이면 자정을 넘기는 구간 (예: 22:00 ~ 02:00)
+                if (lo <= sec <= hi) if lo <= hi else (sec >= lo or sec <= hi):
+                    kept.append(i)
+            idxs = kept
+        return idxs
+
+    def _filter_seconds(self, time_str: str):
+        time_str = time_str.strip()
+        if not self._validate_time(time_str):
+            return None
+        hh, mm, ss = parse_time_str(time_str)
+        return hh * 3600 + mm * 60 + ss
 
     def add_schedule(self):
         title = self.title_var.get().strip()
@@ -217,7 +674,10 @@ class NotifierApp:
             messagebox.showerror("요일 선택", "알림 받을 요일을 최소 1개 이상 선택해 주세요.")
             return
 
-        self.schedules.append(Schedule(title=title, time_str=tstr, days=selected_days))
+        selected_cals = [name for name, v in self.calendar_vars.items() if v.get()]
+
+        self.schedules.append(Schedule(title=title, time_str=tstr, days=selected_days, calendars=selected_cals))
+        self._title_index = None
         self.save_schedules()
         self.refresh_tree()
         self.title_var.set("")
@@ -228,21 +688,150 @@ class NotifierApp:
         if not sel:
             messagebox.showinfo("선택 필요", "삭제할 일정을 선택해 주세요.")
             return
-        idx = int(sel[0])
-        del self.schedules[idx]
-        self.save_schedules()
-        self.refresh_tree()
+        self._delete_indices(int(i) for i in sel)
 
     def toggle_selected(self):
         sel = self.tree.selection()
         if not sel:
             messagebox.showinfo("선택 필요", "토글할 일정을 선택해 주세요.")
             return
-        idx = int(sel[0])
-        self.schedules[idx].active = not self.schedules[idx].active
+        for i in sel:
+            s = self.schedules[int(i)]
+            s.active = not s.active
         self.save_schedules()
         self.refresh_tree()
 
+    def delete_filtered(self):
+        idxs = self.filtered_indices()
+        if not idxs:
+            messagebox.showinfo("대상 없음", "검색/필터 결과가 없습니다.")
+            return
+        if not messagebox.askyesno("일괄 삭제", f"검색/필터 결과 {len(idxs)}개 일정을 삭제할까요?"):
+            return
+        self._delete_indices(idxs)
+
+    def toggle_filtered(self):
+        idxs = self.filtered_indices()
+        if not idxs:
+            messagebox.showinfo("대상 없음", "검색/필터 결과가 없습니다.")
+            return
+        # 모두 사용 중이면 전부 끄고, 하나라도 꺼져 있으면 전부 켬
+        new_active = not all(self.schedules[i].active for i in idxs)
+        for i in idxs:
+            self.schedules[i].active = new_active
+        self.save_schedules()
+        self.refresh_tree()
+
+    def edit_filtered(self):
+        idxs = self.filtered_indices()
+        if not idxs:
+            messagebox.showinfo("대상 없음", "검색/필터 결과가 없습니다.")
+            return
+        # 입력한 시간과 체크한 항목(요일/제외 캘린더)만 적용
+        tstr = self.time_var.get().strip()
+        apply_days = self.batch_days_var.get()
+        apply_cals = self.batch_cals_var.get() and bool(self.calendars)
+        if not (tstr or apply_days or apply_cals):
+            messagebox.showinfo("수정 항목 없음", "알림 시간을 입력하거나 '요일 적용'/'제외 캘린더 적용'을 체크해 주세요.")
+            return
+        if tstr and not self._validate_time(tstr):
+            messagebox.showerror("형식 오류", "시간 형식은 HH:MM 또는 HH:MM:SS 입니다.")
+            return
+        desc = []
+        if tstr:
+            desc.append(f"시간 {tstr}")
+        if apply_days:
+            selected_days = [i for i, v in enumerate(self.day_vars) if v.get()]
+            if not selected_days:
+                messagebox.showerror("요일 선택", "알림 받을 요일을 최소 1개 이상 선택해 주세요.")
+                return
+            desc.append("요일 " + ",".join(KOR_WD[d] for d in selected_days))
+        if apply_cals:
+            selected_cals = [name for name, v in self.calendar_vars.items() if v.get()]
+            desc.append("제외 캘린더 " + (",".join(selected_cals) or "없음"))
+        if not messagebox.askyesno("일괄 수정", f"검색/필터 결과 {len(idxs)}개 일정에 [{' / '.join(desc)}]을(를) 적용할까요?"):
+            return
+        for i in idxs:
+            s = self.schedules[i]
+            if tstr and s.time_str != tstr:
+                s.time_str = tstr
+                s.last_fired_date = ""  # 오늘 이미 울렸어도 바뀐 시간에 다시 알림
+            if apply_days:
+                s.days = list(selected_days)
+            if apply_cals:
+                s.calendars = list(selected_cals)
+        self.save_schedules()
+        self.refresh_tree()
+
+    def _delete_indices(self, idxs):
+        drop = set(idxs)
+        self.schedules = [s for i, s in enumerate(self.schedules) if i not in drop]
+        self._title_index = None
+        self.save_schedules()
+        self.refresh_tree()
+
+    def open_agenda(self):
+        win = tk.Toplevel(self.root)
+        win.title("일정 미리보기")
+        win.geometry("640x480")
+
+        frm_opt = ttk.Frame(win, padding=10)
+        frm_opt.pack(fill="x")
+        ttk.Label(frm_opt, text="기간").pack(side="left", padx=(0, 6))
+        range_var = tk.StringVar(value="7일")
+        cb = ttk.Combobox(frm_opt, textvariable=range_var, values=list(AGENDA_RANGES), state="readonly", width=6)
+        cb.pack(side="left")
+        status_var = tk.StringVar()
+        ttk.Label(frm_opt, textvariable=status_var, foreground="#555").pack(side="left", padx=10)
+
+        frm_list = ttk.Frame(win, padding=(10, 0, 10, 10))
+        frm_list.pack(fill="both", expand=True)
+        columns = ("when", "wd", "title", "dup")
+        tree = ttk.Treeview(frm_list, columns=columns, show="headings")
+        tree.heading("when", text="알림 시각(KST)")
+        tree.heading("wd", text="요일")
+        tree.heading("title", text="제목")
+        tree.heading("dup", text="중복")
+        tree.column("when", width=160, anchor="center")
+        tree.column("wd", width=50, anchor="center")
+        tree.column("title", width=300)
+        tree.column("dup", width=60, anchor="center")
+        tree.tag_configure("dup", foreground="#c0392b")
+        tree.pack(side="left", fill="both", expand=True)
+        scrollbar = ttk.Scrollbar(frm_list, orient="vertical", command=tree.yview)
+        scrollbar.pack(side="right", fill="y")
+
+        state = {"agenda": None, "loaded": 0}
+
+        def load_more():
+            agenda = state["agenda"]
+            for ts, idx, dup in agenda.page(state["loaded"], AGENDA_PAGE_SIZE):
+                dt = datetime.fromtimestamp(ts, self.tz)
+                tree.insert("", "end", values=(dt.strftime("%Y-%m-%d %H:%M:%S"), KOR_WD[dt.weekday()],
+                                               agenda.schedules[idx].title, "중복" if dup else ""),
+                            tags=("dup",) if dup else ())
+                state["loaded"] += 1
+
+        def on_yscroll(first, last):
+            scrollbar.set(first, last)
+            # 스크롤이 끝에 가까워지면 다음 페이지를 붙임
+            if float(last) >= 0.95 and state["agenda"] and state["loaded"] < len(state["agenda"]):
+                load_more()
+
+        def rebuild(_event=None):
+            t0 = time.perf_counter()
+            state["agenda"] = Agenda(self.schedules, self.calendars, self._now_kst(), AGENDA_RANGES[range_var.get()])
+            elapsed_ms = (time.perf_counter() - t0) * 1000
+            tree.delete(*tree.get_children())
+            state["loaded"] = 0
+            load_more()
+            status_var.set(f"총 {len(state['agenda'])}건 (계산 {elapsed_ms:.0f}ms)")
+
+        tree.configure(yscrollcommand=on_yscroll)
+        cb.bind("<<ComboboxSelected>>", rebuild)
+        ttk.Button(frm_opt, text="새로고침", command=rebuild).pack(side="left")
+        rebuild()
+
     def update_interval(self):
         try:
             val = int(self.interval_var.get())
@@ -283,6 +872,8 @@ class NotifierApp:
                 continue
             if s.last_fired_date == today_str:
                 continue
+            if self._is_excluded(s, now):
+                continue
 
             target_dt = self._combine_today_time(now, s.time_str)
             lead = timedelta(minutes=5, seconds=self.interval_sec)
@@ -331,14 +922,14 @@ class NotifierApp:
     def _now_kst(self) -> datetime:
         return datetime.now(self.tz)
 
+    def _is_excluded(self, schedule: Schedule, d: date) -> bool:
+        return is_excluded(schedule, self.calendars, d)
+
+    def _next_occurrence(self, schedule: Schedule, now_kst: datetime, max_days: int = 731):
+        return next_occurrence(schedule, now_kst, self.calendars, max_days)
+
     def _combine_today_time(self, now_kst: datetime, time_str: str) -> datetime:
-        parts = time_str.split(":")
-        if len(parts) == 2:
-            hh, mm = int(parts[0]), int(parts[1]); ss = 0
-        elif len(parts) == 3:
-            hh, mm, ss = int(parts[0]), int(parts[1]), int(parts[2])
-        else:
-            raise ValueError("시간 형식은 HH:MM 또는 HH:MM:SS")
+        hh, mm, ss = parse_time_str(time_str)
         return datetime(now_kst.year, now_kst.month, now_kst.day, hh, mm, ss, tzinfo=self.tz)
 
     def _validate_time(self, time_str: str) -> bool:
@@ -358,7 +949,319 @@ class NotifierApp:
         self.stop_thread()
         self.root.destroy()
 
+# ---------- Headless sharded mode ----------
+def _shard_worker(conn, lead_sec: int):
+    """
+    샤드 워커 프로세스.
+    - 담당 일정을 (알림 시작 epoch) 최소 힙으로 관리하고 가장 가까운 마감까지만 대기
+    - 수신: ("add", [Schedule.to_row(), ...]) / ("remove", [sid, ...]) / ("stop",)
+    - 송신: ("fired", [(sid, 원래 알림 epoch, 알림 예정 epoch), ...])
+      (알림 예정 = max(알림 시작, 등록 시점): 디스패처가 발생 지연 측정에 사용)
+    """
+    tz = kst_timezone()
+    calendars = load_calendars()
+    schedules = {}
+    heap = []
+    seq = 0
+
+    def arm(sid, s, now):
+        nonlocal seq
+        try:
+            nxt = next_occurrence(s, now, calendars)
+        except ValueError:
+            return
+        if nxt is not None:
+            target_ts = nxt.timestamp()
+            seq += 1
+            due_ts = max(target_ts - lead_sec, now.timestamp())
+            heapq.heappush(heap, (due_ts, seq, target_ts, sid, s))
+
+    # 종료는 디스패처가 stop 메시지/파이프 닫기로 처리 (Ctrl+C, SIGTERM은 무시)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    try:
+        while True:
+            timeout = min(max(heap[0][0] - time.time(), 0), 1.0) if heap else 1.0
+            if conn.poll(timeout):
+                msg = conn.recv()
+                if msg[0] == "stop":
+                    break
+                now = datetime.now(tz)
+                if msg[0] == "add":
+                    for row in msg[1]:
+                        s = Schedule.from_row(row)
+                        schedules[s.sid] = s
+                        if s.active:
+                            arm(s.sid, s, now)
+                elif msg[0] == "remove":
+                    for sid in msg[1]:
+                        schedules.pop(sid, None)
+
+            # 힙에 남은 이전 버전(삭제/수정된 일정) 항목은 꺼낼 때 버림
+            now_ts = time.time()
+            fired = []
+            while heap and heap[0][0] <= now_ts:
+                due_ts, _, target_ts, sid, s = heapq.heappop(heap)
+                if schedules.get(sid) is not s:
+                    continue
+                target_dt = datetime.fromtimestamp(target_ts, tz)
+                s.last_fired_date = target_dt.strftime("%Y-%m-%d")
+                fired.append((sid, target_ts, due_ts))
+                arm(sid, s, target_dt)
+            if fired:
+                conn.send(("fired", fired))
+    except (EOFError, OSError):
+        pass  # 디스패처 종료로 파이프가 닫힘
+    conn.close()
+
+class _Shard:
+    """워커 프로세스 1개와 파이프, 송신 큐/스레드"""
+    def __init__(self, index: int, lead_sec: int):
+        self.index = index
+        self.conn, child = multiprocessing.Pipe()
+        self.proc = multiprocessing.Process(target=_shard_worker, args=(child, lead_sec), daemon=True)
+        self.proc.start()
+        child.close()
+        # 파이프 송신은 이 스레드만 담당: 워커가 바빠 send가 막혀도 호출 측은 막히지 않음
+        self.outbox = queue.Queue()
+        self.sender = threading.Thread(target=self._send_loop, daemon=True)
+        self.sender.start()
+
+    def _send_loop(self):
+        while True:
+            msg = self.outbox.get()
+            if msg is None:
+                return
+            try:
+                self.conn.send(msg)
+            except (OSError, ValueError):
+                return
+
+    def put(self, op: str, items):
+        for i in range(0, len(items), SHARD_BATCH):
+            self.outbox.put((op, items[i:i + SHARD_BATCH]))
+
+    def shutdown(self, timeout: float = 2):
+        self.outbox.put(("stop",))
+        self.outbox.put(None)
+        self.proc.join(timeout=timeout)
+        if self.proc.is_alive():
+            self.proc.terminate()
+            self.proc.join()
+
+class ShardedNotifier:
+    """
+    일정을 여러 워커 프로세스에 나눠 평가하는 디스패처.
+    - 일정 id 해시로 샤드를 정하므로 추가/삭제는 담당 샤드에만 전달됨
+    - 파이프 입출력은 잠금 밖에서만 수행 (송신: 샤드별 큐/스레드, 수신: 수신 스레드)
+    - 수신 스레드가 모든 워커의 발생 이벤트를 모아 on_fire(schedule, target_ts) 호출
+    """
+    def __init__(self, workers: int, on_fire, lead_sec: int = ALERT_LEAD_SEC):
+        self.on_fire = on_fire
+        self.lead_sec = lead_sec
+        self.schedules = {}   # sid -> Schedule (원본)
+        self._owner = {}      # sid -> 샤드 번호
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self.latencies = deque(maxlen=100000)
+        self._shards = [_Shard(i, lead_sec) for i in range(max(1, workers))]
+        self._listener = threading.Thread(target=self._listen, daemon=True)
+        self._listener.start()
+
+    def add(self, schedules):
+        """일정 추가 (같은 sid가 있으면 교체)"""
+        with self._lock:
+            adds = {}
+            for s in schedules:
+                shard = hash(s.sid) % len(self._shards)
+                self.schedules[s.sid] = s
+                self._owner[s.sid] = shard
+                adds.setdefault(shard, []).append(s.to_row())
+            for shard, items in adds.items():
+                self._shards[shard].put("add", items)
+
+    def remove(self, sids):
+        with self._lock:
+            removes = {}
+            for sid in sids:
+                self.schedules.pop(sid, None)
+                shard = self._owner.pop(sid, None)
+                if shard is not None:
+                    removes.setdefault(shard, []).append(sid)
+            for shard, items in removes.items():
+                self._shards[shard].put("remove", items)
+
+    def sync(self, schedules):
+        """파일에서 다시 읽은 일정 목록과 비교해 추가/수정/삭제분만 반영"""
+        with self._lock:
+            incoming = {s.sid: s for s in schedules}
+            gone = [sid for sid in self.schedules if sid not in incoming]
+            changed = []
+            for sid, s in incoming.items():
+                cur = self.schedules.get(sid)
+                if cur is not None:
+                    # 시간이 그대로면 메모리의 최근 발송일 유지 (중복 알림 방지),
+                    # 시간이 바뀌었으면 GUI 일괄 수정과 같이 발송일을 지워 바뀐 시간에 다시 알림
+                    if s.time_str == cur.time_str:
+                        s.last_fired_date = max(s.last_fired_date, cur.last_fired_date)
+                    else:
+                        s.last_fired_date = ""
+                    if cur == s:
+                        continue
+                changed.append(s)
+            if gone:
+                self.remove(gone)
+            if changed:
+                self.add(changed)
+
+    def snapshot_rows(self):
+        """저장용 스냅샷 (잠금은 목록을 복사하는 동안만 유지)"""
+        with self._lock:
+            schedules = list(self.schedules.values())
+        return [s.to_row() for s in schedules]
+
+    def _listen(self):
+        dead = set()
+        while True:
+            with self._lock:
+                shards = list(self._shards)
+            if self._stop.is_set() and not shards:
+                return
+            conns = {sh.conn: sh for sh in shards if sh.conn not in dead}
+            if not conns:
+                time.sleep(0.1)
+                continue
+            try:
+                ready = mp_wait(list(conns), timeout=0.5)
+            except (OSError, ValueError):
+                continue  # 종료 중 닫힌 연결
+            for conn in ready:
+                shard = conns[conn]
+                try:
+                    _, fired = conn.recv()
+                except (EOFError, OSError):
+                    dead.add(conn)
+                    if not self._stop.is_set():
+                        self._restart(shard)
+                    continue
+                self._apply_fired(shard, fired)
+
+    def _apply_fired(self, shard, fired):
+        now_ts = time.time()
+        due = []
+        with self._lock:
+            if self._stop.is_set():
+                return
+            for sid, target_ts, due_ts in fired:
+                s = self.schedules.get(sid)
+                if s is None or self._owner.get(sid) != shard.index:
+                    continue
+                s.last_fired_date = datetime.fromtimestamp(target_ts, kst_timezone()).strftime("%Y-%m-%d")
+                self.latencies.append(now_ts - due_ts)
+                due.append((s, target_ts))
+        for s, target_ts in due:
+            try:
+                self.on_fire(s, target_ts)
+            except Exception as e:
+                print("알림 처리 오류:", e)
+
+    def _restart(self, shard):
+        """비정상 종료된 워커를 다시 띄우고 담당 일정을 재전송"""
+        with self._lock:
+            if self._stop.is_set() or self._shards[shard.index] is not shard:
+                return
+            print(f"샤드 {shard.index} 워커 재시작")
+            new = _Shard(shard.index, self.lead_sec)
+            self._shards[shard.index] = new
+            new.put("add", [self.schedules[sid].to_row() for sid, w in self._owner.items() if w == shard.index])
+        shard.shutdown(timeout=1)
+        shard.conn.close()
+
+    def latency_percentiles(self):
+        lat = sorted(self.latencies)
+        if not lat:
+            return None
+        return lat[len(lat) // 2], lat[min(len(lat) - 1, int(len(lat) * 0.99))]
+
+    def stop(self):
+        # 먼저 _stop을 세워 이후의 EOF를 워커 비정상 종료로 보지 않게 함
+        self._stop.set()
+        with self._lock:
+            shards = list(self._shards)
+        for sh in shards:
+            sh.shutdown()
+        with self._lock:
+            self._shards = []
+        self._listener.join(timeout=1)
+        for sh in shards:
+            sh.sender.join(timeout=1)
+            sh.conn.close()
+
+def run_headless(workers: int):
+    """GUI 없이 동작: 알림은 표준 출력으로 기록, 데이터 파일 변경 시 자동 반영"""
+    migrate_legacy_file()
+    tz = kst_timezone()
+    state = {"dirty": False, "mtime": 0}
+
+    def on_fire(schedule, target_ts):
+        tstr = datetime.fromtimestamp(target_ts, tz).strftime("%Y-%m-%d %H:%M:%S")
+        print(f"[{datetime.now(tz):%Y-%m-%d %H:%M:%S}] 일정 알림: {schedule.title} (원래 알림 시각: {tstr} KST)", flush=True)
+        state["dirty"] = True
+
+    def save():
+        state["dirty"] = False
+        write_schedule_rows(notifier.snapshot_rows())
+        state["mtime"] = DATA_FILE.stat().st_mtime
+
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))  # 서비스 종료 시에도 저장/정리
+    notifier = None
+    try:
+        schedules, missing_ids = read_schedules_checked()
+        state["mtime"] = DATA_FILE.stat().st_mtime if DATA_FILE.exists() else 0
+        notifier = ShardedNotifier(workers, on_fire)
+        notifier.add(schedules)
+        if missing_ids:
+            save()  # sid가 없던 일정에 부여한 id를 저장
+        print(f"헤드리스 모드: 일정 {len(schedules)}개, 워커 {workers}개 (데이터 파일: {DATA_FILE})", flush=True)
+
+        last_save = time.time()
+        while True:
+            time.sleep(1)
+            mtime = DATA_FILE.stat().st_mtime if DATA_FILE.exists() else 0
+            if mtime != state["mtime"]:
+                state["mtime"] = mtime
+                try:
+                    schedules, missing_ids = read_schedules_checked()
+                    notifier.sync(schedules)
+                    if missing_ids:
+                        # 바로 저장하지 않으면 다시 읽을 때마다 새 id가 부여되어 중복 알림 발생
+                        save()
+                except Exception as e:
+                    print("일정 다시 읽기 오류:", e)
+            if state["dirty"] and time.time() - last_save >= HEADLESS_SAVE_SEC:
+                save()
+                last_save = time.time()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if notifier is not None:
+            notifier.stop()
+            if state["dirty"]:
+                save()
+            pct = notifier.latency_percentiles()
+            if pct:
+                print(f"알림 지연 p50={pct[0] * 1000:.1f}ms p99={pct[1] * 1000:.1f}ms", flush=True)
+
 def main():
+    multiprocessing.freeze_support()
+    parser = argparse.ArgumentParser(description="KST Daily Notifier")
+    parser.add_argument("--headless", action="store_true", help="GUI 없이 대량 일정 처리 (알림은 표준 출력)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="헤드리스 모드 워커 프로세스 수")
+    args = parser.parse_args()
+    if args.headless:
+        run_headless(args.workers)
+        return
+
     root = tk.Tk()
     app = NotifierApp(root)
     root.protocol("WM_DELETE_WINDOW", app.on_close)